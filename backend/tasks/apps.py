@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class TasksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tasks'
+
+    def ready(self):
+        from .scoring import warm_up
+        from .scoring_numba import _NUMBA_AVAILABLE
+
+        # Compile the Numba kernels at startup instead of on the first request
+        if _NUMBA_AVAILABLE:
+            warm_up()
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 11:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['due_date'], name='tasks_task_due_dat_bce847_idx'),
+        ),
+    ]
@@ -1,6 +1,92 @@
+from datetime import date, timedelta
+from typing import Optional
+
 from django.db import models
+from django.db.models import Case, F, FloatField, IntegerField, Value, When
+from django.db.models.functions import Least
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from .scoring import (
+    EFFORT_SCORES,
+    EFFORT_THRESHOLDS,
+    URGENCY_SCORES,
+    URGENCY_THRESHOLDS,
+    resolve_weights,
+)
+
+
+class TaskQuerySet(models.QuerySet):
+    """QuerySet that can compute priority scores inside the database."""
+
+    def with_priority_score(
+        self,
+        strategy: str = 'smart_balance',
+        custom_weights: Optional[dict] = None,
+        today: Optional[date] = None
+    ) -> 'TaskQuerySet':
+        """
+        Annotate urgency, importance, effort and priority_score in SQL.
+
+        Mirrors the step functions in scoring.py using plain CASE expressions
+        on due_date and estimated_hours, so rows can be ordered and paginated
+        by priority without loading them into Python. The dependency
+        component is not computed (it would need every other row's JSON
+        dependencies) and contributes 0.
+
+        Args:
+            strategy: Scoring strategy to use
+            custom_weights: Optional custom weights (overrides strategy)
+            today: Reference date for urgency (defaults to current date)
+
+        Returns:
+            Annotated QuerySet; order with .order_by('-priority_score')
+        """
+        if today is None:
+            today = date.today()
+        w_urgency, w_importance, w_effort, _ = resolve_weights(strategy, custom_weights)
+
+        # Overdue: 100 + 5 per day late, capped at 150 from 10 days late
+        urgency_cases = [When(due_date__lte=today - timedelta(days=10), then=Value(150))]
+        urgency_cases += [
+            When(due_date=today - timedelta(days=days), then=Value(100 + days * 5))
+            for days in range(9, 0, -1)
+        ]
+        urgency_cases += [
+            When(due_date__lte=today + timedelta(days=days), then=Value(score))
+            for days, score in zip(URGENCY_THRESHOLDS, URGENCY_SCORES)
+        ]
+        # Beyond a month: 30 minus one point per further week, floored at 10
+        urgency_cases += [
+            When(due_date__lte=today + timedelta(days=36 + 7 * week), then=Value(30 - week))
+            for week in range(20)
+        ]
+        urgency = Case(*urgency_cases, default=Value(10), output_field=IntegerField())
+
+        # Over 16 hours: 30 minus 5 per further 8 hours, floored at 10
+        effort_cases = [
+            When(estimated_hours__lte=hours, then=Value(score))
+            for hours, score in zip(EFFORT_THRESHOLDS, EFFORT_SCORES)
+        ]
+        effort_cases += [
+            When(estimated_hours__lt=24 + 8 * step, then=Value(30 - 5 * step))
+            for step in range(4)
+        ]
+        effort = Case(*effort_cases, default=Value(10), output_field=IntegerField())
+
+        return self.annotate(
+            urgency_score=urgency,
+            importance_score=F('importance') * 10,
+            effort_score=effort,
+        ).annotate(
+            priority_score=Least(
+                F('urgency_score') * Value(w_urgency) +
+                F('importance_score') * Value(w_importance) +
+                F('effort_score') * Value(w_effort),
+                Value(100.0),
+                output_field=FloatField(),
+            ),
+        )
+
 
 class Task(models.Model):
     """
@@ -25,8 +111,13 @@ class Task(models.Model):
     dependencies = models.JSONField(default=list, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = TaskQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['due_date']),
+        ]
 
     def __str__(self):
         return self.title
@@ -0,0 +1,35 @@
+"""
+orjson-backed JSON renderer for the API.
+
+orjson encodes several times faster than the standard json module and
+serializes dates and NumPy scalars/arrays natively, so values coming out of
+the batch scorer can be returned without converting them first.
+"""
+
+from decimal import Decimal
+
+import orjson
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer
+
+
+def _default(obj):
+    """Encode the few types orjson does not handle natively."""
+    if isinstance(obj, (Decimal, Promise)):
+        return str(obj)
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Render response data as UTF-8 JSON with orjson."""
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        # Non-str keys: DRF ListField errors are keyed by item index
+        return orjson.dumps(
+            data, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
@@ -20,8 +20,26 @@ Scoring Components:
    - Based on how many other tasks depend on this task
 """
 
+from bisect import bisect_left, bisect_right
+import functools
+import hashlib
+import threading
+from collections import Counter, OrderedDict
 from datetime import date, timedelta
-from typing import Optional
+from itertools import chain
+from typing import Mapping, Optional
+
+import numpy as np
+import orjson
+
+from .scoring_numba import _NUMBA_AVAILABLE, score_batch, strongly_connected_components
+
+# Maximum number of analyze_tasks results kept in the in-process LRU cache
+ANALYSIS_CACHE_SIZE = 128
+
+# Maximum number of returned tasks held across all cached results; payloads
+# larger than this are scored directly and never cached
+ANALYSIS_CACHE_MAX_TASKS = 10_000
 
 
 # Default weights for the "Smart Balance" strategy
@@ -56,114 +74,233 @@ STRATEGY_WEIGHTS = {
 }
 
 
-def calculate_urgency_score(due_date: date, today: Optional[date] = None) -> tuple[float, str]:
+# Step-function lookup tables shared by the scalar scorers and the batch scorer.
+# Each *_THRESHOLDS entry is an inclusive upper bound for the matching score.
+
+# Urgency for tasks not yet overdue, by days until due
+URGENCY_THRESHOLDS = (0, 1, 3, 7, 14, 30)
+URGENCY_SCORES = (100, 95, 85, 70, 50, 30)
+URGENCY_LABELS = (
+    "Due TODAY",
+    "Due TOMORROW",
+    "Due in {days} days (this week)",
+    "Due in {days} days (within a week)",
+    "Due in {days} days (within 2 weeks)",
+    "Due in {days} days (within a month)",
+)
+
+# Effort, by estimated hours
+EFFORT_THRESHOLDS = (1, 2, 4, 8, 16)
+EFFORT_SCORES = (100, 85, 70, 50, 30)
+EFFORT_LABELS = (
+    "Quick win (under 1 hour)",
+    "Short task (1-2 hours)",
+    "Medium task (2-4 hours)",
+    "Half-day task (4-8 hours)",
+    "Full day task (8-16 hours)",
+)
+
+# Importance level names, by minimum rating
+IMPORTANCE_LEVEL_THRESHOLDS = (3, 5, 7, 9)
+IMPORTANCE_LEVELS = ("Minimal", "Low", "Medium", "High", "Critical")
+
+# Level name for each valid rating, indexed by rating - 1
+IMPORTANCE_LEVEL_BY_RATING = tuple(
+    IMPORTANCE_LEVELS[bisect_right(IMPORTANCE_LEVEL_THRESHOLDS, rating)] for rating in range(1, 11)
+)
+
+# NumPy copies of the score tables for the batch scorer, built once at import
+# rather than converted from tuples on every call
+_URGENCY_THRESHOLD_LUT = np.array(URGENCY_THRESHOLDS, dtype=np.int64)
+_URGENCY_SCORE_LUT = np.array(URGENCY_SCORES, dtype=np.int16)
+_EFFORT_THRESHOLD_LUT = np.array(EFFORT_THRESHOLDS, dtype=np.float64)
+_EFFORT_SCORE_LUT = np.array(EFFORT_SCORES, dtype=np.int16)
+
+# Priority level names, indexed by level code (0 = Low, 1 = Medium, 2 = High),
+# and the minimum score for each level above Low
+PRIORITY_LEVELS = np.array(['Low', 'Medium', 'High'])
+_PRIORITY_LEVEL_LUT = np.array([50.0, 80.0])
+
+
+def _normalize_weights(weights: dict) -> tuple[float, float, float, float]:
+    """Normalize weights to sum to 1 and return them in component order."""
+    total_weight = sum(weights.values())
+    return (
+        weights['urgency'] / total_weight,
+        weights['importance'] / total_weight,
+        weights['effort'] / total_weight,
+        weights['dependency'] / total_weight,
+    )
+
+
+# Strategy weights never change, so normalize them once at import
+_NORMALIZED_STRATEGY_WEIGHTS = {
+    name: _normalize_weights(weights) for name, weights in STRATEGY_WEIGHTS.items()
+}
+
+
+def _make_combiner(w_urgency: float, w_importance: float, w_effort: float, w_dependency: float):
+    """Build a function computing the weighted sum of the four component scores."""
+    def combine(urgency, importance, effort, dependency):
+        return (
+            urgency * w_urgency +
+            importance * w_importance +
+            effort * w_effort +
+            dependency * w_dependency
+        )
+    return combine
+
+
+# One pre-bound combiner per built-in strategy, so the hot path needs no
+# weight lookups or normalization
+_STRATEGY_COMBINERS = {
+    name: _make_combiner(*weights) for name, weights in _NORMALIZED_STRATEGY_WEIGHTS.items()
+}
+
+
+def resolve_weights(
+    strategy: str = 'smart_balance',
+    custom_weights: Optional[dict] = None
+) -> tuple[float, float, float, float]:
+    """
+    Resolve the weights for a strategy (or custom override), normalized to sum to 1.
+
+    Args:
+        strategy: Scoring strategy to use
+        custom_weights: Optional custom weights (overrides strategy)
+
+    Returns:
+        Tuple of normalized (urgency, importance, effort, dependency) weights
+    """
+    if custom_weights:
+        return _normalize_weights({**DEFAULT_WEIGHTS, **custom_weights})
+    return _NORMALIZED_STRATEGY_WEIGHTS.get(strategy, _NORMALIZED_STRATEGY_WEIGHTS['smart_balance'])
+
+
+def calculate_urgency_score(
+    due_date: date,
+    today: Optional[date] = None,
+    explain: bool = True
+) -> tuple[float, Optional[str]]:
     """
     Calculate urgency score based on days until due date.
 
     Args:
         due_date: The task's due date
         today: Reference date (defaults to current date)
+        explain: Whether to build the explanation string
 
     Returns:
-        Tuple of (score, explanation)
+        Tuple of (score, explanation); explanation is None if explain is False
     """
     if today is None:
         today = date.today()
 
-    days_until_due = (due_date - today).days
+    # Ordinal arithmetic avoids allocating a timedelta just to read .days
+    days_until_due = due_date.toordinal() - today.toordinal()
 
     if days_until_due < 0:
         # Past due - maximum urgency with penalty
-        days_overdue = abs(days_until_due)
-        score = min(100 + (days_overdue * 5), 150)  # Cap at 150 for past due
-        explanation = f"OVERDUE by {days_overdue} day(s)"
-    elif days_until_due == 0:
-        score = 100
-        explanation = "Due TODAY"
-    elif days_until_due == 1:
-        score = 95
-        explanation = "Due TOMORROW"
-    elif days_until_due <= 3:
-        score = 85
-        explanation = f"Due in {days_until_due} days (this week)"
-    elif days_until_due <= 7:
-        score = 70
-        explanation = f"Due in {days_until_due} days (within a week)"
-    elif days_until_due <= 14:
-        score = 50
-        explanation = f"Due in {days_until_due} days (within 2 weeks)"
-    elif days_until_due <= 30:
-        score = 30
-        explanation = f"Due in {days_until_due} days (within a month)"
+        score = min(100 - (days_until_due * 5), 150)  # Cap at 150 for past due
     else:
-        # Far future - minimal urgency
-        score = max(10, 30 - (days_until_due - 30) // 7)
-        explanation = f"Due in {days_until_due} days (low urgency)"
+        bucket = bisect_left(URGENCY_THRESHOLDS, days_until_due)
+        if bucket < len(URGENCY_SCORES):
+            score = URGENCY_SCORES[bucket]
+        else:
+            # Far future - minimal urgency
+            score = max(10, 30 - (days_until_due - 30) // 7)
+
+    return score, (explain_urgency(days_until_due) if explain else None)
+
+
+def explain_urgency(days_until_due: int) -> str:
+    """Describe the urgency bucket for a task due in days_until_due days."""
+    if days_until_due < 0:
+        return f"OVERDUE by {-days_until_due} day(s)"
 
-    return score, explanation
+    bucket = bisect_left(URGENCY_THRESHOLDS, days_until_due)
+    if bucket < len(URGENCY_LABELS):
+        return URGENCY_LABELS[bucket].format(days=days_until_due)
+    return f"Due in {days_until_due} days (low urgency)"
 
 
-def calculate_importance_score(importance: int) -> tuple[float, str]:
+def calculate_importance_score(importance: int, explain: bool = True) -> tuple[float, Optional[str]]:
     """
     Convert importance rating (1-10) to score (0-100).
 
     Args:
         importance: User-provided importance rating (1-10)
+        explain: Whether to build the explanation string
 
     Returns:
-        Tuple of (score, explanation)
+        Tuple of (score, explanation); explanation is None if explain is False
     """
     # Direct linear mapping: 1 -> 10, 10 -> 100
     score = importance * 10
+    return score, (explain_importance(importance) if explain else None)
 
-    if importance >= 9:
-        level = "Critical"
-    elif importance >= 7:
-        level = "High"
-    elif importance >= 5:
-        level = "Medium"
-    elif importance >= 3:
-        level = "Low"
-    else:
-        level = "Minimal"
 
-    explanation = f"Importance: {level} ({importance}/10)"
-    return score, explanation
+def explain_importance(importance: int) -> str:
+    """Describe the importance level for a 1-10 rating."""
+    # The table only covers integer ratings; anything else goes via bisect
+    if isinstance(importance, int) and 1 <= importance <= 10:
+        level = IMPORTANCE_LEVEL_BY_RATING[importance - 1]
+    else:
+        level = IMPORTANCE_LEVELS[bisect_right(IMPORTANCE_LEVEL_THRESHOLDS, importance)]
+    return f"Importance: {level} ({importance}/10)"
 
 
-def calculate_effort_score(estimated_hours: float) -> tuple[float, str]:
+def calculate_effort_score(estimated_hours: float, explain: bool = True) -> tuple[float, Optional[str]]:
     """
     Calculate effort score - lower effort tasks get higher scores (quick wins).
 
     Args:
         estimated_hours: Estimated time to complete the task
+        explain: Whether to build the explanation string
 
     Returns:
-        Tuple of (score, explanation)
+        Tuple of (score, explanation); explanation is None if explain is False
     """
-    if estimated_hours <= 1:
-        score = 100
-        explanation = "Quick win (under 1 hour)"
-    elif estimated_hours <= 2:
-        score = 85
-        explanation = "Short task (1-2 hours)"
-    elif estimated_hours <= 4:
-        score = 70
-        explanation = "Medium task (2-4 hours)"
-    elif estimated_hours <= 8:
-        score = 50
-        explanation = "Half-day task (4-8 hours)"
-    elif estimated_hours <= 16:
-        score = 30
-        explanation = "Full day task (8-16 hours)"
+    bucket = bisect_left(EFFORT_THRESHOLDS, estimated_hours)
+    if bucket < len(EFFORT_SCORES):
+        score = EFFORT_SCORES[bucket]
     else:
         score = max(10, 30 - (estimated_hours - 16) // 8 * 5)
-        explanation = f"Large task ({estimated_hours} hours)"
 
-    return score, explanation
+    return score, (explain_effort(estimated_hours) if explain else None)
+
+
+def explain_effort(estimated_hours: float) -> str:
+    """Describe the effort bucket for a task of estimated_hours."""
+    bucket = bisect_left(EFFORT_THRESHOLDS, estimated_hours)
+    if bucket < len(EFFORT_LABELS):
+        return EFFORT_LABELS[bucket]
+    return f"Large task ({estimated_hours} hours)"
+
+
+def count_dependents(all_tasks: list[dict]) -> Counter:
+    """
+    Count, for every task ID, how many tasks list it as a dependency.
+
+    Built in a single pass so callers scoring many tasks can look up each
+    task's dependent count instead of rescanning the whole list per task.
+
+    Args:
+        all_tasks: List of all tasks to check dependencies
+
+    Returns:
+        Counter mapping task ID to number of dependent tasks
+    """
+    return Counter(chain.from_iterable(
+        set(task.get('dependencies') or ()) for task in all_tasks
+    ))
 
 
-def calculate_dependency_score(task_id: Optional[int], all_tasks: list[dict]) -> tuple[float, str]:
+def calculate_dependency_score(
+    task_id: Optional[int],
+    all_tasks: Optional[list[dict]] = None,
+    dependent_counts: Optional[Mapping[int, int]] = None
+) -> tuple[float, str]:
     """
     Calculate dependency score based on how many tasks depend on this task.
     Tasks that block others should be prioritized.
@@ -171,6 +308,8 @@ def calculate_dependency_score(task_id: Optional[int], all_tasks: list[dict]) ->
     Args:
         task_id: The ID of the current task
         all_tasks: List of all tasks to check dependencies
+        dependent_counts: Precomputed counts from count_dependents()
+            (takes precedence over all_tasks when given)
 
     Returns:
         Tuple of (score, explanation)
@@ -179,79 +318,128 @@ def calculate_dependency_score(task_id: Optional[int], all_tasks: list[dict]) ->
         return 0, "No task ID (dependency check skipped)"
 
     # Count how many tasks depend on this task
-    dependent_count = 0
-    for task in all_tasks:
-        dependencies = task.get('dependencies', [])
-        if task_id in dependencies:
-            dependent_count += 1
+    if dependent_counts is None:
+        dependent_counts = count_dependents(all_tasks or [])
+    dependent_count = dependent_counts.get(task_id, 0)
 
     if dependent_count == 0:
         score = 0
-        explanation = "No tasks blocked by this"
     elif dependent_count == 1:
         score = 50
-        explanation = "Blocks 1 other task"
     elif dependent_count == 2:
         score = 75
-        explanation = "Blocks 2 other tasks"
     else:
         score = min(100, 50 + dependent_count * 15)
-        explanation = f"Blocks {dependent_count} other tasks (high priority)"
 
-    return score, explanation
+    return score, explain_dependency(dependent_count)
 
 
-def detect_circular_dependencies(tasks: list[dict]) -> list[tuple[int, int]]:
+def explain_dependency(dependent_count: int) -> str:
+    """Describe how many tasks are blocked by a task."""
+    if dependent_count == 0:
+        return "No tasks blocked by this"
+    if dependent_count == 1:
+        return "Blocks 1 other task"
+    if dependent_count == 2:
+        return "Blocks 2 other tasks"
+    return f"Blocks {dependent_count} other tasks (high priority)"
+
+
+def render_explanation(
+    days_until_due: int,
+    importance: int,
+    estimated_hours: float,
+    dependent_count: int
+) -> str:
     """
-    Detect circular dependencies in the task list.
+    Build a task's full explanation from its raw scoring inputs.
+
+    Only needs the inputs, not the scores, so callers can score in bulk and
+    render text later for just the tasks they return.
 
     Args:
-        tasks: List of tasks with dependencies
+        days_until_due: Days from today to the due date (negative if overdue)
+        importance: Importance rating (1-10)
+        estimated_hours: Estimated hours
+        dependent_count: Number of tasks depending on this task
 
     Returns:
-        List of tuples representing circular dependency pairs
+        Explanation parts joined with " | "
     """
-    circular = []
-    task_ids = {task.get('id') for task in tasks if task.get('id') is not None}
+    explanations = [
+        explain_urgency(days_until_due),
+        explain_importance(importance),
+        explain_effort(estimated_hours),
+    ]
+    if dependent_count > 0:
+        explanations.append(explain_dependency(dependent_count))
+    return " | ".join(explanations)
+
+
+def build_dependency_csr(tasks: list[dict]) -> tuple[list[int], np.ndarray, np.ndarray]:
+    """
+    Pack the task dependency graph into CSR arrays over dense node indices.
+
+    Dependencies on IDs that are not in the task list are dropped, and
+    repeated dependencies collapse into a single edge.
 
-    # Build adjacency list
+    Args:
+        tasks: List of tasks with dependencies
+
+    Returns:
+        Tuple of (node_ids, indptr, indices) where node_ids maps dense index
+        back to task ID and indices[indptr[i]:indptr[i + 1]] are the nodes
+        that node i depends on
+    """
     graph = {}
     for task in tasks:
         task_id = task.get('id')
         if task_id is not None:
-            graph[task_id] = task.get('dependencies', [])
-
-    # DFS to detect cycles
-    def has_cycle(node, visited, rec_stack, path):
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
-
-        for neighbor in graph.get(node, []):
-            if neighbor not in task_ids:
-                continue
-            if neighbor not in visited:
-                cycle = has_cycle(neighbor, visited, rec_stack, path)
-                if cycle:
-                    return cycle
-            elif neighbor in rec_stack:
-                # Found cycle
-                cycle_start = path.index(neighbor)
-                return path[cycle_start:]
-
-        path.pop()
-        rec_stack.remove(node)
-        return None
-
-    visited = set()
-    for task_id in task_ids:
-        if task_id not in visited:
-            cycle = has_cycle(task_id, visited, set(), [])
-            if cycle and len(cycle) >= 2:
-                for i in range(len(cycle)):
-                    circular.append((cycle[i], cycle[(i + 1) % len(cycle)]))
-
-    return circular
+            # dict.fromkeys dedupes while keeping the listed order
+            graph[task_id] = dict.fromkeys(task.get('dependencies') or ())
+
+    node_ids = list(graph)
+    id_to_idx = {task_id: idx for idx, task_id in enumerate(node_ids)}
+
+    indptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+    flat = []
+    for idx, deps in enumerate(graph.values()):
+        flat.extend(id_to_idx[dep] for dep in deps if dep in id_to_idx)
+        indptr[idx + 1] = len(flat)
+
+    return node_ids, indptr, np.array(flat, dtype=np.int64)
+
+
+def detect_circular_dependencies(tasks: list[dict]) -> list[tuple[int, int]]:
+    """
+    Detect circular dependencies in the task list.
+
+    Uses a single Tarjan SCC pass, so every dependency edge that lies on a
+    cycle is reported exactly once. Self-dependencies are ignored.
+
+    Args:
+        tasks: List of tasks with dependencies
+
+    Returns:
+        List of tuples representing circular dependency pairs
+    """
+    node_ids, indptr, indices = build_dependency_csr(tasks)
+    n = len(node_ids)
+    component, n_components = strongly_connected_components(indptr, indices, n)
+
+    # Every edge inside an SCC of two or more tasks lies on a cycle
+    component_size = np.bincount(component, minlength=n_components)
+    sources = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    in_cycle = (
+        (component[sources] == component[indices]) &
+        (component_size[component[sources]] >= 2) &
+        (sources != indices)
+    )
+
+    return [
+        (node_ids[src], node_ids[dst])
+        for src, dst in zip(sources[in_cycle].tolist(), indices[in_cycle].tolist())
+    ]
 
 
 def calculate_priority_score(
@@ -259,7 +447,8 @@ def calculate_priority_score(
     all_tasks: list[dict],
     strategy: str = 'smart_balance',
     custom_weights: Optional[dict] = None,
-    today: Optional[date] = None
+    today: Optional[date] = None,
+    dependent_counts: Optional[Mapping[int, int]] = None
 ) -> dict:
     """
     Calculate the overall priority score for a task.
@@ -270,35 +459,27 @@ def calculate_priority_score(
         strategy: Scoring strategy to use
         custom_weights: Optional custom weights (overrides strategy)
         today: Reference date for urgency calculation
+        dependent_counts: Precomputed counts from count_dependents()
 
     Returns:
         Dictionary with task data plus priority_score, priority_level, and explanation
     """
-    # Get weights based on strategy or custom
+    # Built-in strategies use a pre-bound combiner; custom weights build one
     if custom_weights:
-        weights = {**DEFAULT_WEIGHTS, **custom_weights}
+        combine = _make_combiner(*resolve_weights(strategy, custom_weights))
     else:
-        weights = STRATEGY_WEIGHTS.get(strategy, DEFAULT_WEIGHTS)
-
-    # Normalize weights to sum to 1
-    total_weight = sum(weights.values())
-    weights = {k: v / total_weight for k, v in weights.items()}
+        combine = _STRATEGY_COMBINERS.get(strategy, _STRATEGY_COMBINERS['smart_balance'])
 
     # Calculate individual scores
     urgency_score, urgency_exp = calculate_urgency_score(task['due_date'], today)
     importance_score, importance_exp = calculate_importance_score(task['importance'])
     effort_score, effort_exp = calculate_effort_score(task['estimated_hours'])
     dependency_score, dependency_exp = calculate_dependency_score(
-        task.get('id'), all_tasks
+        task.get('id'), all_tasks, dependent_counts
     )
 
     # Calculate weighted score
-    weighted_score = (
-        urgency_score * weights['urgency'] +
-        importance_score * weights['importance'] +
-        effort_score * weights['effort'] +
-        dependency_score * weights['dependency']
-    )
+    weighted_score = combine(urgency_score, importance_score, effort_score, dependency_score)
 
     # Normalize to 0-100 scale (accounting for past-due bonus)
     priority_score = min(100, weighted_score)
@@ -318,73 +499,396 @@ def calculate_priority_score(
 
     explanation = " | ".join(explanations)
 
+    result = dict(task)
+    result['priority_score'] = round(priority_score, 2)
+    result['priority_level'] = priority_level
+    result['explanation'] = explanation
+    result['score_breakdown'] = {
+        'urgency': round(urgency_score, 2),
+        'importance': round(importance_score, 2),
+        'effort': round(effort_score, 2),
+        'dependency': round(dependency_score, 2),
+    }
+    return result
+
+
+def build_task_columns(
+    tasks: list[dict],
+    due_dates: list[date],
+    dependent_counts: Mapping[int, int],
+    today: date
+) -> dict[str, np.ndarray]:
+    """
+    Convert task dicts into the struct-of-arrays layout used by score_tasks_batch.
+
+    Days and dependent counts are int32 and hours float64. Importance is
+    int8 when every rating is an integer from 1 to 10, float64 otherwise.
+
+    Args:
+        tasks: List of task dictionaries
+        due_dates: Parsed due date of each task (parallel to tasks)
+        dependent_counts: Precomputed counts from count_dependents()
+        today: Reference date for urgency
+
+    Returns:
+        Dictionary of arrays keyed like score_tasks_batch's parameters
+    """
+    n = len(tasks)
+    today_ordinal = today.toordinal()
+    ratings = [task['importance'] for task in tasks]
+    if all(type(rating) is int and 1 <= rating <= 10 for rating in ratings):
+        importance = np.array(ratings, dtype=np.int8)
+    else:
+        importance = np.array(ratings, dtype=np.float64)
     return {
-        **task,
-        'priority_score': round(priority_score, 2),
-        'priority_level': priority_level,
-        'explanation': explanation,
-        'score_breakdown': {
-            'urgency': round(urgency_score, 2),
-            'importance': round(importance_score, 2),
-            'effort': round(effort_score, 2),
-            'dependency': round(dependency_score, 2),
+        # Integer day ordinals avoid allocating a timedelta per task
+        'days_until_due': np.fromiter(
+            (due_date.toordinal() - today_ordinal for due_date in due_dates), dtype=np.int32, count=n
+        ),
+        'importance': importance,
+        'estimated_hours': np.fromiter(
+            (task['estimated_hours'] for task in tasks), dtype=np.float64, count=n
+        ),
+        'dependent_count': np.fromiter(
+            (dependent_counts.get(task.get('id'), 0) if task.get('id') is not None else 0
+             for task in tasks),
+            dtype=np.int32, count=n
+        ),
+    }
+
+
+def _importance_scores(importance: np.ndarray) -> np.ndarray:
+    """Importance ratings times 10, widened so narrow integer ratings cannot overflow."""
+    return importance * np.int16(10)
+
+
+def score_tasks_batch(
+    days_until_due: np.ndarray,
+    importance: np.ndarray,
+    estimated_hours: np.ndarray,
+    dependent_count: np.ndarray,
+    weights: tuple[float, float, float, float]
+) -> dict[str, np.ndarray]:
+    """
+    Vectorized equivalent of calculate_priority_score for many tasks at once.
+
+    Applies the same step functions as the calculate_*_score helpers to whole
+    arrays, so scoring N tasks costs a handful of NumPy passes instead of N
+    rounds of Python function calls. When Numba is installed the work is done
+    by the fused score_batch kernel in a single compiled loop instead.
+
+    Args:
+        days_until_due: Days from today to each due date (negative if overdue)
+        importance: Importance ratings (1-10)
+        estimated_hours: Estimated hours per task
+        dependent_count: Number of tasks depending on each task
+        weights: Normalized (urgency, importance, effort, dependency) weights
+            from resolve_weights()
+
+    Returns:
+        Dictionary of arrays: priority_score, priority_level and the four
+        component scores (urgency, importance, effort, dependency)
+    """
+    if _NUMBA_AVAILABLE:
+        priority_score, level, urgency, effort, dependency = score_batch(
+            days_until_due, importance, estimated_hours, dependent_count,
+            _URGENCY_THRESHOLD_LUT, _URGENCY_SCORE_LUT, _EFFORT_THRESHOLD_LUT, _EFFORT_SCORE_LUT,
+            *weights,
+        )
+        return {
+            'priority_score': np.round(priority_score, 2),
+            'priority_level': PRIORITY_LEVELS[level],
+            'urgency': urgency,
+            'importance': _importance_scores(importance),
+            'effort': effort,
+            'dependency': dependency,
         }
+
+    days = days_until_due
+    # side='left' matches bisect_left in the scalar scorers (inclusive bounds)
+    urgency_bucket = np.searchsorted(_URGENCY_THRESHOLD_LUT, days, side='left')
+    urgency = np.where(
+        days < 0,
+        np.minimum(100 - days * 5, 150),
+        np.where(
+            urgency_bucket < len(URGENCY_SCORES),
+            np.take(_URGENCY_SCORE_LUT, urgency_bucket, mode='clip'),
+            np.maximum(10, 30 - (days - 30) // 7),
+        ),
+    )
+
+    importance_score = _importance_scores(importance)
+
+    effort_bucket = np.searchsorted(_EFFORT_THRESHOLD_LUT, estimated_hours, side='left')
+    effort = np.where(
+        effort_bucket < len(EFFORT_SCORES),
+        np.take(_EFFORT_SCORE_LUT, effort_bucket, mode='clip'),
+        np.maximum(10, 30 - np.floor((estimated_hours - 16) / 8).astype(np.int64) * 5),
+    )
+
+    dependency = np.select(
+        [dependent_count == 0, dependent_count == 1, dependent_count == 2],
+        [0, 50, 75],
+        default=np.minimum(100, 50 + dependent_count * 15),
+    )
+
+    w_urgency, w_importance, w_effort, w_dependency = weights
+    weighted = (
+        urgency * w_urgency +
+        importance_score * w_importance +
+        effort * w_effort +
+        dependency * w_dependency
+    )
+    priority_score = np.minimum(100, weighted)
+
+    # side='right' puts a score equal to a threshold in the higher level;
+    # overdue tasks (urgency above 100) are always High
+    level = np.searchsorted(_PRIORITY_LEVEL_LUT, priority_score, side='right')
+    level[urgency > 100] = 2
+
+    return {
+        'priority_score': np.round(priority_score, 2),
+        'priority_level': PRIORITY_LEVELS[level],
+        'urgency': urgency,
+        'importance': importance_score,
+        'effort': effort,
+        'dependency': dependency,
     }
 
 
+def rank_scores(priority_score: np.ndarray, top_k: Optional[int] = None) -> np.ndarray:
+    """
+    Return task indices ordered by descending priority score.
+
+    Ties keep input order, exactly as a stable full sort would. When top_k is
+    smaller than the number of tasks, only the best top_k indices are
+    selected (O(N) partition) and sorted, instead of sorting everything.
+
+    Args:
+        priority_score: Array of priority scores
+        top_k: Optional number of top tasks to return
+
+    Returns:
+        Array of task indices, best first
+    """
+    n = len(priority_score)
+    if top_k is None or top_k >= n:
+        return np.argsort(-priority_score, kind='stable')
+    if top_k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    # Value of the top_k-th best score; keep everything above it plus the
+    # earliest ties needed to fill top_k slots
+    kth_score = np.partition(priority_score, n - top_k)[n - top_k]
+    above = np.flatnonzero(priority_score > kth_score)
+    ties = np.flatnonzero(priority_score == kth_score)[:top_k - len(above)]
+    candidates = np.sort(np.concatenate([above, ties]))
+    return candidates[np.argsort(-priority_score[candidates], kind='stable')]
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso_date(value: str) -> date:
+    """Parse an ISO date string, memoized since due dates tend to repeat."""
+    return date.fromisoformat(value)
+
+
+def _fingerprint(*parts) -> bytes:
+    """
+    16-byte digest of JSON-like data, used as the analysis cache key.
+
+    The data is encoded as canonical JSON (sorted keys, dates as ISO strings),
+    so 2 and 2.0 give different digests. Raises TypeError for data that
+    cannot be encoded.
+    """
+    payload = orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+_analysis_cache: OrderedDict = OrderedDict()
+_analysis_cache_lock = threading.Lock()
+
+_CONTAINER_TYPES = (list, dict)
+
+
+def _copy_result(result: dict) -> dict:
+    """
+    Copy an analyze_tasks result so the cache and the caller never share state.
+
+    Copies the result dict, each task dict and the lists and dicts directly
+    inside a task, plus the circular_dependencies list.
+    """
+    copied = dict(result)
+    copied['tasks'] = [
+        {key: value.copy() if isinstance(value, _CONTAINER_TYPES) else value
+         for key, value in task.items()}
+        for task in result['tasks']
+    ]
+    if 'circular_dependencies' in result:
+        copied['circular_dependencies'] = list(result['circular_dependencies'])
+    return copied
+
+
+def clear_analysis_cache() -> None:
+    """Drop every cached analyze_tasks result."""
+    with _analysis_cache_lock:
+        _analysis_cache.clear()
+
+
 def analyze_tasks(
     tasks: list[dict],
     strategy: str = 'smart_balance',
-    custom_weights: Optional[dict] = None
+    custom_weights: Optional[dict] = None,
+    return_breakdown: bool = True,
+    top_k: Optional[int] = None,
+    today: Optional[date] = None,
+    detect_cycles: bool = True
 ) -> dict:
     """
     Analyze a list of tasks and return them sorted by priority.
 
+    Results are memoized in a small LRU cache keyed on a digest of the full
+    task content and scoring options plus today's date, so repeated requests
+    with the same tasks (e.g. dashboard polling) skip all scoring work.
+    Callers always get their own copy. The cache holds at most
+    ANALYSIS_CACHE_SIZE results and ANALYSIS_CACHE_MAX_TASKS tasks in total.
+
+    Every cacheable call pays for the digest and one result copy, so a miss
+    is slower than scoring without the cache; it only pays off when payloads
+    repeat. Payloads over ANALYSIS_CACHE_MAX_TASKS skip the cache entirely.
+
     Args:
         tasks: List of task dictionaries
         strategy: Scoring strategy to use
         custom_weights: Optional custom weights
+        return_breakdown: Whether to include each task's score_breakdown
+        top_k: Only return the top_k highest-priority tasks (all if None)
+        today: Reference date for urgency (defaults to current date, read once
+            per call)
+        detect_cycles: Whether to run circular dependency detection; when
+            False the circular_dependencies key is omitted
 
     Returns:
         Dictionary with sorted tasks and metadata
     """
-    # Validate and convert dates
+    if today is None:
+        today = date.today()
+    if len(tasks) > ANALYSIS_CACHE_MAX_TASKS:
+        return _analyze_tasks(
+            tasks, strategy, custom_weights, return_breakdown, top_k, today, detect_cycles
+        )
+    try:
+        # today is part of the key, so cached results expire at midnight
+        key = (
+            _fingerprint(tasks, strategy, custom_weights, return_breakdown, top_k, detect_cycles),
+            today.toordinal(),
+        )
+    except TypeError:
+        # Task data we cannot fingerprint is simply never cached
+        return _analyze_tasks(
+            tasks, strategy, custom_weights, return_breakdown, top_k, today, detect_cycles
+        )
+
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(key)
+        if cached is not None:
+            _analysis_cache.move_to_end(key)
+
+    if cached is not None:
+        return _copy_result(cached)
+
+    # The fresh result goes to the caller and a copy into the cache, so a
+    # miss costs one copy just like a hit. The copy also stops the cache
+    # from aliasing lists the result shares with the caller's input.
+    result = _analyze_tasks(
+        tasks, strategy, custom_weights, return_breakdown, top_k, today, detect_cycles
+    )
+    with _analysis_cache_lock:
+        _analysis_cache[key] = _copy_result(result)
+        cached_tasks = sum(len(entry['tasks']) for entry in _analysis_cache.values())
+        while len(_analysis_cache) > ANALYSIS_CACHE_SIZE or cached_tasks > ANALYSIS_CACHE_MAX_TASKS:
+            _, evicted = _analysis_cache.popitem(last=False)
+            cached_tasks -= len(evicted['tasks'])
+    return result
+
+
+def _analyze_tasks(
+    tasks: list[dict],
+    strategy: str,
+    custom_weights: Optional[dict],
+    return_breakdown: bool,
+    top_k: Optional[int],
+    today: date,
+    detect_cycles: bool
+) -> dict:
+    """Uncached implementation of analyze_tasks, scoring relative to today."""
+    # Parse or format each due date exactly once: the date object is kept
+    # for arithmetic and the ISO string goes straight into the output.
+    # Dependency lists are copied so results never alias the caller's input.
     processed_tasks = []
+    due_dates = []
     for task in tasks:
         processed = dict(task)
-        if isinstance(processed['due_date'], str):
-            processed['due_date'] = date.fromisoformat(processed['due_date'])
+        dependencies = processed.get('dependencies')
+        if isinstance(dependencies, list):
+            processed['dependencies'] = dependencies.copy()
+        due_date = processed['due_date']
+        if isinstance(due_date, str):
+            due_date = _parse_iso_date(due_date)
+        else:
+            processed['due_date'] = due_date.isoformat()
         processed_tasks.append(processed)
-
-    # Check for circular dependencies
-    circular_deps = detect_circular_dependencies(processed_tasks)
-
-    # Calculate scores for each task
-    scored_tasks = [
-        calculate_priority_score(task, processed_tasks, strategy, custom_weights)
-        for task in processed_tasks
-    ]
-
-    # Sort by priority score (descending)
-    scored_tasks.sort(key=lambda x: x['priority_score'], reverse=True)
-
-    # Convert dates back to string for JSON serialization
-    for task in scored_tasks:
-        if isinstance(task['due_date'], date):
-            task['due_date'] = task['due_date'].isoformat()
-
-    return {
+        due_dates.append(due_date)
+
+    # Count dependents once instead of rescanning the list for every task
+    dependent_counts = count_dependents(processed_tasks)
+    weights = resolve_weights(strategy, custom_weights)
+
+    # Score all tasks in one vectorized pass over struct-of-arrays columns
+    n = len(processed_tasks)
+    columns = build_task_columns(processed_tasks, due_dates, dependent_counts, today)
+    scores = score_tasks_batch(**columns, weights=weights)
+    days_until_due = columns['days_until_due']
+    dependent_count = columns['dependent_count']
+
+    # Sort by priority score (descending); stable so ties keep input order
+    order = rank_scores(scores['priority_score'], top_k)
+
+    # Explanations are only built for the tasks actually returned, from the
+    # inputs already gathered above; processed_tasks are private copies, so
+    # results are written into them in place.
+    scored_tasks = []
+    for i in order.tolist():
+        task = processed_tasks[i]
+        task['priority_score'] = scores['priority_score'][i].item()
+        task['priority_level'] = str(scores['priority_level'][i])
+        task['explanation'] = render_explanation(
+            int(days_until_due[i]), task['importance'], task['estimated_hours'],
+            int(dependent_count[i]),
+        )
+        if return_breakdown:
+            task['score_breakdown'] = {
+                'urgency': scores['urgency'][i].item(),
+                'importance': scores['importance'][i].item(),
+                'effort': scores['effort'][i].item(),
+                'dependency': scores['dependency'][i].item(),
+            }
+        scored_tasks.append(task)
+
+    result = {
         'tasks': scored_tasks,
         'strategy': strategy,
-        'circular_dependencies': circular_deps,
-        'total_tasks': len(scored_tasks),
+        'total_tasks': n,
     }
+    if detect_cycles:
+        result['circular_dependencies'] = detect_circular_dependencies(processed_tasks)
+    return result
 
 
 def get_suggested_tasks(
     tasks: list[dict],
     count: int = 3,
-    strategy: str = 'smart_balance'
+    strategy: str = 'smart_balance',
+    today: Optional[date] = None
 ) -> list[dict]:
     """
     Get the top N suggested tasks to work on today.
@@ -393,14 +897,16 @@ def get_suggested_tasks(
         tasks: List of task dictionaries
         count: Number of suggestions to return
         strategy: Scoring strategy to use
+        today: Reference date for urgency (defaults to current date)
 
     Returns:
         List of top tasks with detailed explanations
     """
-    result = analyze_tasks(tasks, strategy)
+    # Suggestions never report cycles, so skip the graph pass entirely
+    result = analyze_tasks(tasks, strategy, top_k=count, today=today, detect_cycles=False)
     suggestions = []
 
-    for i, task in enumerate(result['tasks'][:count]):
+    for i, task in enumerate(result['tasks']):
         reason_parts = []
 
         # Build detailed reason based on score breakdown
@@ -418,11 +924,25 @@ def get_suggested_tasks(
         if not reason_parts:
             reason_parts.append("balanced priority")
 
-        suggestion = {
-            **task,
-            'rank': i + 1,
-            'reason': f"Recommended because: {', '.join(reason_parts)}",
-        }
-        suggestions.append(suggestion)
+        # Tasks from analyze_tasks are fresh dicts, so extend them in place
+        task['rank'] = i + 1
+        task['reason'] = f"Recommended because: {', '.join(reason_parts)}"
+        suggestions.append(task)
 
     return suggestions
+
+
+def warm_up() -> None:
+    """
+    Run the scoring path once on a tiny task list.
+
+    With Numba installed this triggers (or loads from cache) compilation of
+    the kernels, so the first real request does not pay for it.
+    """
+    tasks = [
+        {'id': 1, 'title': 'warm-up', 'due_date': date.today(), 'estimated_hours': 1.0,
+         'importance': 5, 'dependencies': [2]},
+        {'id': 2, 'title': 'warm-up', 'due_date': date.today(), 'estimated_hours': 1.0,
+         'importance': 5, 'dependencies': [1]},
+    ]
+    _analyze_tasks(tasks, 'smart_balance', None, True, None, date.today(), True)
@@ -0,0 +1,229 @@
+"""
+Optional Numba-compiled kernels for the scoring module.
+
+Numba is not a hard requirement. When it is installed the kernels below are
+compiled with @njit; otherwise the very same functions run as plain Python,
+so callers never need to branch on availability.
+
+Kernels operate on the task dependency graph packed in CSR form:
+    indptr:  int64 array of length n + 1
+    indices: int64 array; indices[indptr[i]:indptr[i + 1]] are the dense
+             indices of the tasks that task i depends on
+"""
+
+from array import array
+
+import numpy as np
+
+try:
+    from numba import njit
+    _NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _NUMBA_AVAILABLE = False
+
+
+def _jit(func):
+    """Compile func with Numba when available, otherwise return it unchanged."""
+    if _NUMBA_AVAILABLE:
+        try:
+            return njit(cache=True)(func)
+        except RuntimeError:
+            # No writable cache directory (e.g. a read-only container):
+            # compile on every start instead of failing at import
+            return njit(func)
+    return func
+
+
+def strongly_connected_components(indptr, indices, n):
+    """
+    Label every node with its strongly connected component (iterative Tarjan).
+
+    Runs in O(V + E): each node is pushed once and each edge examined once.
+    An explicit call stack with per-node edge cursors replaces recursion.
+
+    The work buffers are NumPy arrays for the compiled kernel. Without Numba
+    they are array.array buffers and the CSR arrays are converted to lists,
+    because plain Python indexes those several times faster than NumPy
+    arrays accessed element by element.
+
+    Args:
+        indptr: CSR row pointer array (int64, length n + 1)
+        indices: CSR column index array (int64)
+        n: Number of nodes
+
+    Returns:
+        Tuple (component, n_components): component[i] is the SCC label of
+        node i, in the order Tarjan's algorithm completes them
+    """
+    if _NUMBA_AVAILABLE:
+        index = np.full(n, -1, np.int64)
+        lowlink = np.zeros(n, np.int64)
+        on_stack = np.zeros(n, np.bool_)
+        edge_pos = np.zeros(n, np.int64)
+        call_stack = np.empty(n, np.int64)
+        scc_stack = np.empty(n, np.int64)
+        component = np.full(n, -1, np.int64)
+    else:
+        indptr = indptr.tolist()
+        indices = indices.tolist()
+        index = array('q', [-1]) * n
+        lowlink = array('q', [0]) * n
+        on_stack = array('b', [0]) * n
+        edge_pos = array('q', [0]) * n
+        call_stack = array('q', [0]) * n
+        scc_stack = array('q', [0]) * n
+        component = array('q', [-1]) * n
+
+    n_components = _tarjan(
+        indptr, indices, n, index, lowlink, on_stack, edge_pos, call_stack, scc_stack, component
+    )
+    return np.asarray(component, dtype=np.int64), n_components
+
+
+@_jit
+def _tarjan(indptr, indices, n, index, lowlink, on_stack, edge_pos, call_stack, scc_stack, component):
+    """Tarjan's SCC core: fills component in place and returns the SCC count."""
+    counter = 0
+    sp = 0
+    n_components = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+
+        index[root] = counter
+        lowlink[root] = counter
+        counter += 1
+        scc_stack[sp] = root
+        sp += 1
+        on_stack[root] = True
+        edge_pos[root] = indptr[root]
+        top = 0
+        call_stack[0] = root
+
+        while top >= 0:
+            v = call_stack[top]
+            if edge_pos[v] < indptr[v + 1]:
+                w = indices[edge_pos[v]]
+                edge_pos[v] += 1
+
+                if index[w] == -1:
+                    # Descend into w
+                    index[w] = counter
+                    lowlink[w] = counter
+                    counter += 1
+                    scc_stack[sp] = w
+                    sp += 1
+                    on_stack[w] = True
+                    edge_pos[w] = indptr[w]
+                    top += 1
+                    call_stack[top] = w
+                elif on_stack[w] and index[w] < lowlink[v]:
+                    lowlink[v] = index[w]
+            else:
+                if lowlink[v] == index[v]:
+                    # v is the root of an SCC: pop it off the SCC stack
+                    while True:
+                        sp -= 1
+                        w = scc_stack[sp]
+                        on_stack[w] = False
+                        component[w] = n_components
+                        if w == v:
+                            break
+                    n_components += 1
+
+                # Return to the caller and propagate the lowlink
+                top -= 1
+                if top >= 0:
+                    u = call_stack[top]
+                    if lowlink[v] < lowlink[u]:
+                        lowlink[u] = lowlink[v]
+
+    return n_components
+
+
+@_jit
+def score_batch(
+    days_until_due, importance, estimated_hours, dependent_count,
+    urgency_thresholds, urgency_scores, effort_thresholds, effort_scores,
+    w_urgency, w_importance, w_effort, w_dependency
+):
+    """
+    Fused single-pass version of the vectorized batch scorer.
+
+    Computes the component scores and their weighted combination per task
+    in one loop, using the same threshold tables as scoring.py.
+
+    Args:
+        days_until_due: int32 days from today to each due date
+        importance: int8 (or float64) importance ratings
+        estimated_hours: float64 estimated hours per task
+        dependent_count: int32 number of dependent tasks per task
+        urgency_thresholds, urgency_scores: urgency step table
+        effort_thresholds, effort_scores: effort step table
+        w_urgency, w_importance, w_effort, w_dependency: normalized weights
+
+    Returns:
+        Tuple (priority_score, priority_level, urgency, effort, dependency);
+        priority_score is capped at 100 but unrounded and priority_level is
+        0 (Low), 1 (Medium) or 2 (High). The importance component
+        (importance * 10) is left to the caller.
+    """
+    n = days_until_due.shape[0]
+    priority_score = np.empty(n, np.float64)
+    priority_level = np.empty(n, np.int8)
+    urgency = np.empty(n, np.int16)
+    effort = np.empty(n, np.int16)
+    dependency = np.empty(n, np.int16)
+    n_urgency = urgency_thresholds.shape[0]
+    n_effort = effort_thresholds.shape[0]
+
+    for i in range(n):
+        days = days_until_due[i]
+        if days < 0:
+            u = min(100 - days * 5, 150)
+        else:
+            bucket = 0
+            while bucket < n_urgency and days > urgency_thresholds[bucket]:
+                bucket += 1
+            if bucket < n_urgency:
+                u = urgency_scores[bucket]
+            else:
+                u = max(10, 30 - (days - 30) // 7)
+
+        hours = estimated_hours[i]
+        bucket = 0
+        while bucket < n_effort and hours > effort_thresholds[bucket]:
+            bucket += 1
+        if bucket < n_effort:
+            e = effort_scores[bucket]
+        else:
+            e = max(10, 30 - int(np.floor((hours - 16) / 8)) * 5)
+
+        count = dependent_count[i]
+        if count == 0:
+            d = 0
+        elif count == 1:
+            d = 50
+        elif count == 2:
+            d = 75
+        else:
+            d = min(100, 50 + count * 15)
+
+        imp = importance[i] * 10
+        score = min(100.0, u * w_urgency + imp * w_importance + e * w_effort + d * w_dependency)
+
+        if score >= 80 or u > 100:
+            level = 2
+        elif score >= 50:
+            level = 1
+        else:
+            level = 0
+
+        priority_score[i] = score
+        priority_level[i] = level
+        urgency[i] = u
+        effort[i] = e
+        dependency[i] = d
+
+    return priority_score, priority_level, urgency, effort, dependency
@@ -1,17 +1,32 @@
+import json
 from datetime import date, timedelta
+from io import BytesIO
+from unittest import mock
+
+import numpy as np
 from django.test import TestCase
+from rest_framework.exceptions import ParseError
 from rest_framework.test import APITestCase
 from rest_framework import status
 
+from . import scoring, scoring_numba
+from .models import Task
+from .parsers import ORJSONParser
+from .renderers import ORJSONRenderer
 from .scoring import (
     calculate_urgency_score,
     calculate_importance_score,
     calculate_effort_score,
     calculate_dependency_score,
     calculate_priority_score,
+    count_dependents,
     analyze_tasks,
+    clear_analysis_cache,
     detect_circular_dependencies,
     get_suggested_tasks,
+    rank_scores,
+    resolve_weights,
+    score_tasks_batch,
     STRATEGY_WEIGHTS,
 )
 
@@ -60,6 +75,16 @@ class UrgencyScoreTests(TestCase):
 
         self.assertLess(score, 30)
 
+    def test_explain_false_skips_explanation(self):
+        """Scores should not change when the explanation is skipped."""
+        for days in (-3, 0, 1, 5, 20, 60):
+            due = self.today + timedelta(days=days)
+            score, _ = calculate_urgency_score(due, self.today)
+
+            self.assertEqual(
+                calculate_urgency_score(due, self.today, explain=False), (score, None)
+            )
+
 
 class ImportanceScoreTests(TestCase):
     """Tests for the importance scoring component."""
@@ -91,6 +116,13 @@ class ImportanceScoreTests(TestCase):
             score, _ = calculate_importance_score(i)
             self.assertEqual(score, i * 10)
 
+    def test_fractional_importance(self):
+        """Non-integer ratings should score and explain like the levels around them."""
+        score, explanation = calculate_importance_score(5.5)
+
+        self.assertEqual(score, 55.0)
+        self.assertEqual(explanation, 'Importance: Medium (5.5/10)')
+
 
 class EffortScoreTests(TestCase):
     """Tests for the effort scoring component (quick wins prioritization)."""
@@ -164,6 +196,22 @@ class DependencyScoreTests(TestCase):
 
         self.assertEqual(score, 0)
 
+    def test_precomputed_counts_match_scan(self):
+        """Precomputed dependent counts should give the same score as a scan."""
+        tasks = [
+            {'id': 1, 'dependencies': []},
+            {'id': 2, 'dependencies': [1, 1]},  # Duplicate entries count once
+            {'id': 3, 'dependencies': [1, 2]},
+        ]
+        counts = count_dependents(tasks)
+
+        self.assertEqual(counts[1], 2)
+        for task_id in (1, 2, 3):
+            self.assertEqual(
+                calculate_dependency_score(task_id, dependent_counts=counts),
+                calculate_dependency_score(task_id, tasks),
+            )
+
 
 class CircularDependencyTests(TestCase):
     """Tests for circular dependency detection."""
@@ -200,6 +248,33 @@ class CircularDependencyTests(TestCase):
 
         self.assertGreater(len(circular), 0)
 
+    def test_cycle_pairs_follow_dependencies(self):
+        """Reported pairs should be real dependency edges forming the cycle."""
+        tasks = [
+            {'id': 10, 'dependencies': [30, 99]},  # 99 is not a known task
+            {'id': 20, 'dependencies': [10]},
+            {'id': 30, 'dependencies': [20]},
+            {'id': 40, 'dependencies': [10]},
+        ]
+        circular = detect_circular_dependencies(tasks)
+
+        self.assertEqual(sorted(circular), [(10, 30), (20, 10), (30, 20)])
+
+    def test_reports_every_cycle_edge_once(self):
+        """Overlapping and disjoint cycles should all be reported, without duplicates."""
+        tasks = [
+            {'id': 1, 'dependencies': [2]},
+            {'id': 2, 'dependencies': [1, 3]},
+            {'id': 3, 'dependencies': [2]},
+            {'id': 4, 'dependencies': [5]},
+            {'id': 5, 'dependencies': [4, 5]},  # Self-dependency is ignored
+        ]
+        circular = detect_circular_dependencies(tasks)
+
+        self.assertEqual(
+            sorted(circular), [(1, 2), (2, 1), (2, 3), (3, 2), (4, 5), (5, 4)]
+        )
+
 
 class PriorityScoreTests(TestCase):
     """Tests for the overall priority scoring function."""
@@ -260,6 +335,123 @@ class PriorityScoreTests(TestCase):
         self.assertTrue(len(result['explanation']) > 0)
 
 
+class BatchScoringTests(TestCase):
+    """Tests for the vectorized batch scorer."""
+
+    def test_matches_scalar_scoring(self):
+        """Batch scores should match calculate_priority_score task by task."""
+        today = date(2025, 11, 26)
+        tasks = [
+            {'id': i, 'title': f'Task {i}', 'due_date': today + timedelta(days=days),
+             'estimated_hours': hours, 'importance': importance, 'dependencies': deps}
+            for i, (days, hours, importance, deps) in enumerate([
+                (-5, 0.5, 10, []),
+                (0, 1, 1, [0]),
+                (1, 2.5, 5, [0]),
+                (3, 8, 7, [0, 1]),
+                (10, 16, 3, [0]),
+                (25, 20, 9, []),
+                (90, 100, 2, []),
+            ])
+        ]
+        counts = count_dependents(tasks)
+        weights = resolve_weights('smart_balance')
+
+        scores = score_tasks_batch(
+            days_until_due=np.array([(t['due_date'] - today).days for t in tasks]),
+            importance=np.array([t['importance'] for t in tasks]),
+            estimated_hours=np.array([t['estimated_hours'] for t in tasks], dtype=float),
+            dependent_count=np.array([counts.get(t['id'], 0) for t in tasks]),
+            weights=weights,
+        )
+
+        for i, task in enumerate(tasks):
+            expected = calculate_priority_score(task, tasks, 'smart_balance', None, today)
+            self.assertAlmostEqual(scores['priority_score'][i], expected['priority_score'])
+            self.assertEqual(scores['priority_level'][i], expected['priority_level'])
+            for component, value in expected['score_breakdown'].items():
+                self.assertEqual(scores[component][i], value)
+
+    def test_numba_and_numpy_paths_agree(self):
+        """The fused Numba kernel and the NumPy fallback should give identical results."""
+        rng = np.random.default_rng(0)
+        n = 500
+        columns = {
+            'days_until_due': rng.integers(-30, 400, n, dtype=np.int32),
+            'importance': rng.integers(1, 11, n, dtype=np.int8),
+            'estimated_hours': np.round(rng.uniform(0.1, 80, n), 1),
+            'dependent_count': rng.integers(0, 6, n, dtype=np.int32),
+        }
+        weights = resolve_weights('smart_balance')
+
+        with mock.patch('tasks.scoring._NUMBA_AVAILABLE', True):
+            fused = score_tasks_batch(**columns, weights=weights)
+        with mock.patch('tasks.scoring._NUMBA_AVAILABLE', False):
+            vectorized = score_tasks_batch(**columns, weights=weights)
+
+        for key, values in vectorized.items():
+            np.testing.assert_array_equal(fused[key], values)
+
+    def test_non_integer_and_out_of_range_importance(self):
+        """Ratings outside the int8 fast path should score like the scalar scorer."""
+        today = date(2025, 11, 26)
+        tasks = [
+            {'id': i, 'title': f'Task {i}', 'due_date': today + timedelta(days=3),
+             'estimated_hours': 2, 'importance': importance, 'dependencies': []}
+            for i, importance in enumerate([5.5, 20, 7])
+        ]
+
+        for numba_available in (True, False):
+            clear_analysis_cache()
+            with mock.patch('tasks.scoring._NUMBA_AVAILABLE', numba_available):
+                result = analyze_tasks(tasks, today=today, detect_cycles=False)
+            for task in result['tasks']:
+                expected = calculate_priority_score(tasks[task['id']], tasks, today=today)
+                self.assertEqual(task['priority_score'], expected['priority_score'])
+                self.assertEqual(task['score_breakdown'], expected['score_breakdown'])
+
+    def test_priority_level_boundaries(self):
+        """Scores of exactly 50 and 80 move up a level; overdue tasks are High."""
+        with mock.patch('tasks.scoring._NUMBA_AVAILABLE', False):
+            scores = score_tasks_batch(
+                days_until_due=np.array([30, 30, 30, 30, -1]),
+                importance=np.array([4, 5, 7, 8, 1]),
+                estimated_hours=np.full(5, 1.0),
+                dependent_count=np.zeros(5, dtype=np.int64),
+                weights=(0.0, 1.0, 0.0, 0.0),
+            )
+
+        self.assertEqual(scores['priority_level'].tolist(), ['Low', 'Medium', 'Medium', 'High', 'High'])
+
+
+    def test_jit_falls_back_without_cache_directory(self):
+        """A missing Numba cache locator should not break importing the kernels."""
+        def njit(func=None, cache=False):
+            if cache:
+                raise RuntimeError('cannot cache function: no locator available')
+            return func
+
+        def kernel():
+            return 1
+
+        with mock.patch.object(scoring_numba, '_NUMBA_AVAILABLE', True), \
+                mock.patch.object(scoring_numba, 'njit', njit, create=True):
+            self.assertIs(scoring_numba._jit(kernel), kernel)
+
+
+class RankScoresTests(TestCase):
+    """Tests for ranking tasks by priority score."""
+
+    def test_top_k_matches_full_stable_sort(self):
+        """Partial top-k selection should match a stable full sort, ties included."""
+        scores = np.array([50.0, 70.0, 50.0, 90.0, 70.0, 50.0, 10.0])
+        full = rank_scores(scores).tolist()
+
+        self.assertEqual(full, [3, 1, 4, 0, 2, 5, 6])
+        for k in range(len(scores) + 2):
+            self.assertEqual(rank_scores(scores, k).tolist(), full[:k])
+
+
 class StrategyTests(TestCase):
     """Tests for different sorting strategies."""
 
@@ -295,21 +487,21 @@ class StrategyTests(TestCase):
 
     def test_fastest_wins_prioritizes_effort(self):
         """Fastest wins strategy should prioritize quick tasks."""
-        result = analyze_tasks(self.tasks, 'fastest_wins')
+        result = analyze_tasks(self.tasks, 'fastest_wins', today=self.today)
 
         # Quick task should rank first
         self.assertEqual(result['tasks'][0]['id'], 1)
 
     def test_high_impact_prioritizes_importance(self):
         """High impact strategy should prioritize important tasks."""
-        result = analyze_tasks(self.tasks, 'high_impact')
+        result = analyze_tasks(self.tasks, 'high_impact', today=self.today)
 
         # Important task should rank first
         self.assertEqual(result['tasks'][0]['id'], 2)
 
     def test_deadline_driven_prioritizes_urgency(self):
         """Deadline driven strategy should prioritize urgent tasks."""
-        result = analyze_tasks(self.tasks, 'deadline_driven')
+        result = analyze_tasks(self.tasks, 'deadline_driven', today=self.today)
 
         # Urgent task should rank first
         self.assertEqual(result['tasks'][0]['id'], 3)
@@ -317,7 +509,7 @@ class StrategyTests(TestCase):
     def test_custom_weights_applied(self):
         """Custom weights should override strategy weights."""
         custom = {'urgency': 0, 'importance': 0, 'effort': 1, 'dependency': 0}
-        result = analyze_tasks(self.tasks, 'smart_balance', custom)
+        result = analyze_tasks(self.tasks, 'smart_balance', custom, today=self.today)
 
         # With only effort weight, quick task should rank first
         self.assertEqual(result['tasks'][0]['id'], 1)
@@ -357,6 +549,82 @@ class AnalyzeTasksTests(TestCase):
         self.assertEqual(result['strategy'], 'fastest_wins')
         self.assertEqual(result['total_tasks'], 1)
 
+    def test_breakdown_optional_and_input_untouched(self):
+        """score_breakdown can be skipped, and input tasks are never mutated."""
+        task = {'id': 1, 'title': 'Test', 'due_date': '2025-12-15', 'estimated_hours': 2, 'importance': 5, 'dependencies': []}
+        original = dict(task)
+
+        result = analyze_tasks([task], 'smart_balance', return_breakdown=False)
+
+        self.assertNotIn('score_breakdown', result['tasks'][0])
+        self.assertIn('priority_score', result['tasks'][0])
+        self.assertEqual(task, original)
+
+
+class AnalysisCacheTests(TestCase):
+    """Tests for memoization of analyze_tasks results."""
+
+    def setUp(self):
+        clear_analysis_cache()
+        self.tasks = [
+            {'id': 1, 'title': 'Test', 'due_date': '2025-12-15', 'estimated_hours': 2, 'importance': 5, 'dependencies': []},
+        ]
+
+    def test_repeated_call_is_served_from_cache(self):
+        """Identical calls should score once; a different today should rescore."""
+        today = date(2025, 11, 26)
+
+        with mock.patch.object(scoring, '_analyze_tasks', wraps=scoring._analyze_tasks) as analyze:
+            first = analyze_tasks(self.tasks, 'smart_balance', today=today)
+            second = analyze_tasks(self.tasks, 'smart_balance', today=today)
+            self.assertEqual(analyze.call_count, 1)
+
+            analyze_tasks(self.tasks, 'smart_balance', today=today + timedelta(days=1))
+            self.assertEqual(analyze.call_count, 2)
+
+        self.assertEqual(first, second)
+
+    def test_cached_result_is_an_independent_copy(self):
+        """Mutating a returned result must not leak into later calls."""
+        first = analyze_tasks(self.tasks, 'smart_balance')
+        first['tasks'][0]['priority_score'] = -1
+        first['tasks'][0]['dependencies'].append(99)
+
+        second = analyze_tasks(self.tasks, 'smart_balance')
+        second['tasks'][0]['score_breakdown']['urgency'] = -1
+        third = analyze_tasks(self.tasks, 'smart_balance')
+
+        self.assertEqual(self.tasks[0]['dependencies'], [])
+        self.assertNotEqual(second['tasks'][0]['priority_score'], -1)
+        self.assertEqual(second['tasks'][0]['dependencies'], [])
+        self.assertNotEqual(third['tasks'][0]['score_breakdown']['urgency'], -1)
+
+    def test_changed_input_is_rescored(self):
+        """Any change to the task content should bypass the cached result."""
+        first = analyze_tasks(self.tasks, 'smart_balance')
+        changed = [{**self.tasks[0], 'estimated_hours': 2.0, 'title': 'Renamed'}]
+
+        second = analyze_tasks(changed, 'smart_balance')
+
+        self.assertEqual(second['tasks'][0]['title'], 'Renamed')
+        self.assertIn('Short task', first['tasks'][0]['explanation'])
+        self.assertEqual(second['tasks'][0]['estimated_hours'], 2.0)
+        self.assertIsInstance(second['tasks'][0]['estimated_hours'], float)
+
+
+    def test_cache_is_bounded_by_task_count(self):
+        """Oversized payloads are not cached and the oldest results are evicted."""
+        other = [{**self.tasks[0], 'id': 2}]
+        pair = self.tasks + other
+
+        with mock.patch('tasks.scoring.ANALYSIS_CACHE_MAX_TASKS', 1):
+            analyze_tasks(pair)
+            analyze_tasks(self.tasks)
+            analyze_tasks(other)
+            cached = [[task['id'] for task in entry['tasks']] for entry in scoring._analysis_cache.values()]
+
+        self.assertEqual(cached, [[2]])
+
 
 class SuggestedTasksTests(TestCase):
     """Tests for the get_suggested_tasks function."""
@@ -385,6 +653,54 @@ class SuggestedTasksTests(TestCase):
         self.assertIn('Recommended because', suggestions[0]['reason'])
 
 
+class TaskQuerySetPriorityTests(TestCase):
+    """Tests for computing priority scores in the database."""
+
+    def test_matches_python_scoring(self):
+        """Database-annotated scores should match the Python scorer."""
+        today = date(2025, 11, 26)
+        day_offsets = [-15, -10, -9, -1, 0, 1, 2, 3, 7, 8, 14, 30, 31, 36, 37, 100, 169, 170, 400]
+        hour_values = [0.5, 1, 1.5, 4, 8, 16, 16.5, 24, 31.9, 40, 47.9, 48, 200]
+        for i, days in enumerate(day_offsets):
+            Task.objects.create(
+                title=f'Task {i}',
+                due_date=today + timedelta(days=days),
+                estimated_hours=hour_values[i % len(hour_values)],
+                importance=i % 10 + 1,
+            )
+
+        for strategy in STRATEGY_WEIGHTS:
+            for row in Task.objects.with_priority_score(strategy, today=today):
+                task = {
+                    'due_date': row.due_date,
+                    'estimated_hours': row.estimated_hours,
+                    'importance': row.importance,
+                }
+                expected = calculate_priority_score(task, [], strategy, None, today)
+
+                self.assertEqual(row.urgency_score, expected['score_breakdown']['urgency'])
+                self.assertEqual(row.effort_score, expected['score_breakdown']['effort'])
+                self.assertAlmostEqual(row.priority_score, expected['priority_score'], delta=0.01)
+
+
+class ORJSONCodecTests(TestCase):
+    """Tests for the orjson renderer and parser."""
+
+    def test_renders_dates_and_numpy_values(self):
+        """Dates and NumPy scalars should serialize without conversion."""
+        data = {'due_date': date(2025, 12, 15), 'score': np.float64(82.5), 'ranks': np.arange(3)}
+
+        rendered = ORJSONRenderer().render(data)
+
+        self.assertEqual(rendered, b'{"due_date":"2025-12-15","score":82.5,"ranks":[0,1,2]}')
+
+    def test_parser_rejects_malformed_json(self):
+        """Malformed bodies should raise ParseError (HTTP 400)."""
+        self.assertEqual(ORJSONParser().parse(BytesIO(b'{"tasks": []}')), {'tasks': []})
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(BytesIO(b'{"tasks": ['))
+
+
 class APIEndpointTests(APITestCase):
     """Tests for the API endpoints."""
 
@@ -424,6 +740,21 @@ class APIEndpointTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_non_integer_dependency_returns_400(self):
+        """Index-keyed ListField errors should render as a 400 on both endpoints."""
+        data = {
+            'tasks': [
+                {'title': 'Task 1', 'due_date': '2025-12-15', 'estimated_hours': 2, 'importance': 8,
+                 'dependencies': ['x']},
+            ]
+        }
+
+        for url in ('/api/tasks/analyze/', '/api/tasks/suggest/'):
+            response = self.client.post(url, data, format='json')
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(b'"0":["A valid integer is required."]', response.content)
+
     def test_suggest_endpoint_success(self):
         """POST /api/tasks/suggest/ should return top suggestions."""
         data = {
@@ -440,9 +771,24 @@ class APIEndpointTests(APITestCase):
         self.assertEqual(len(response.data['suggestions']), 2)
         self.assertIn('reason', response.data['suggestions'][0])
 
+    def test_suggest_endpoint_reports_invalid_task_index(self):
+        """Should return 400 naming the first invalid task."""
+        data = {
+            'tasks': [
+                {'title': 'Task 1', 'due_date': '2025-12-15', 'estimated_hours': 2, 'importance': 8},
+                {'title': 'Missing fields'},
+            ]
+        }
+
+        response = self.client.post('/api/tasks/suggest/', data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], 'Invalid task at index 1')
+        self.assertIn('due_date', response.data['details'])
+
     def test_health_endpoint(self):
         """GET /api/health/ should return ok status."""
         response = self.client.get('/api/health/')
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['status'], 'ok')
+        self.assertEqual(json.loads(response.content)['status'], 'ok')
@@ -1,3 +1,5 @@
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
@@ -123,16 +125,23 @@ def suggest_tasks_view(request):
             status=status.HTTP_400_BAD_REQUEST
         )
 
-    # Validate each task
-    validated_tasks = []
-    for i, task in enumerate(tasks_data):
-        task_serializer = TaskInputSerializer(data=task)
-        if not task_serializer.is_valid():
+    # Validate all tasks with a single list serializer
+    task_serializer = TaskInputSerializer(data=tasks_data, many=True)
+    if not task_serializer.is_valid():
+        errors = task_serializer.errors
+        if isinstance(errors, dict):
+            # Not a list of tasks at all
             return Response(
-                {'error': f'Invalid task at index {i}', 'details': task_serializer.errors},
+                {'error': 'Invalid input', 'details': errors},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        validated_tasks.append(task_serializer.validated_data)
+        # Errors are aligned with the input; report the first invalid task
+        i = next(i for i, task_errors in enumerate(errors) if task_errors)
+        return Response(
+            {'error': f'Invalid task at index {i}', 'details': errors[i]},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    validated_tasks = task_serializer.validated_data
 
     try:
         suggestions = get_suggested_tasks(
@@ -159,7 +168,12 @@ def suggest_tasks_view(request):
         )
 
 
-@api_view(['GET'])
+@require_GET
 def health_check(request):
-    """Simple health check endpoint."""
-    return Response({'status': 'ok', 'service': 'task-analyzer'})
+    """
+    Simple health check endpoint.
+
+    A plain Django view: probes hit it constantly and it needs none of DRF's
+    content negotiation or rendering.
+    """
+    return JsonResponse({'status': 'ok', 'service': 'task-analyzer'})